@@ -45,8 +45,7 @@ setup(name=PACKAGE_NAME,
       maintainer_email='christian@beanbaginc.com',
       packages=find_packages(),
       install_requires=[
-          'six',
-          'toml',
+          'tomli; python_version < "3.11"',
           'virtualenv',
       ],
       entry_points={
@@ -55,15 +54,7 @@ setup(name=PACKAGE_NAME,
               'virtualenv-multiver = virtualenv_multiver.main:main',
           ],
       },
-      python_requires=','.join([
-          '>=2.7',
-          '!=3.0.*',
-          '!=3.1.*',
-          '!=3.2.*',
-          '!=3.3.*',
-          '!=3.4.*',
-          '!=3.5.*',
-      ]),
+      python_requires='>=3.6',
       classifiers=[
           'Development Status :: 5 - Production/Stable',
           'Environment :: Other Environment',
@@ -71,8 +62,6 @@ setup(name=PACKAGE_NAME,
           'License :: OSI Approved :: MIT License',
           'Operating System :: OS Independent',
           'Programming Language :: Python',
-          'Programming Language :: Python :: 2',
-          'Programming Language :: Python :: 2.7',
           'Programming Language :: Python :: 3',
           'Programming Language :: Python :: 3.6',
           'Programming Language :: Python :: 3.7',
@@ -6,23 +6,47 @@ Version Added:
 
 import os
 import sys
-
-import six
-from six.moves.configparser import (NoOptionError,
-                                    NoSectionError,
-                                    RawConfigParser)
+from pathlib import PurePath
 
 from virtualenv_multiver.utils import split_pyvers
 
-try:
-    # Python 3.11+
-    import tomllib as toml
-except ImportError:
+
+#: The maximum number of results to keep in the get_pyvers() cache.
+_PYVERS_CACHE_MAX_SIZE = 32
+
+_pyvers_cache = {}
+
+
+def _load_toml(toml_data):
+    """Parse TOML data.
+
+    The TOML parser is imported on first use, rather than at module load,
+    so that it's only loaded when there's a file to parse.
+
+    Args:
+        toml_data (str):
+            The TOML data to parse.
+
+    Returns:
+        dict:
+        The parsed data.
+
+    Raises:
+        ImportError:
+            No TOML parser is installed.
+    """
     try:
-        # Third-party `toml` module for Python.
-        import toml
+        # Python 3.11+
+        import tomllib as toml
     except ImportError:
-        toml = None
+        try:
+            # Third-party backport of tomllib.
+            import tomli as toml
+        except ImportError:
+            # Legacy third-party `toml` module for Python.
+            import toml
+
+    return toml.loads(toml_data)
 
 
 def _load_toml_pyvers(config_path):
@@ -37,17 +61,28 @@ def _load_toml_pyvers(config_path):
         The list of Python versions. This will be ``None`` if versions could
         not be loaded.
     """
-    if toml is None:
-        sys.stderr.write('Unable to parse "%s". The "toml" package is not '
+    try:
+        with open(config_path, 'rb') as fp:
+            raw_data = fp.read()
+    except OSError as e:
+        sys.stderr.write('Unable to read "%s": %s\n'
+                         % (config_path, e))
+        return None
+
+    # Most pyproject.toml files won't have any pydo configuration. Skip
+    # parsing those entirely.
+    if b'pydo' not in raw_data:
+        return None
+
+    try:
+        config_data = _load_toml(raw_data.decode('utf-8'))
+    except ImportError:
+        sys.stderr.write('Unable to parse "%s". The "tomli" package is not '
                          'installed for Python %s.%s.\n'
                          % (config_path,
                             sys.version_info[0],
                             sys.version_info[1]))
         return None
-
-    try:
-        with open(config_path, 'r') as fp:
-            config_data = toml.load(fp)
     except Exception as e:
         sys.stderr.write('Unable to read "%s": %s\n'
                          % (config_path, e))
@@ -58,13 +93,13 @@ def _load_toml_pyvers(config_path):
     except KeyError:
         return None
 
-    if isinstance(pyvers, six.string_types):
+    if isinstance(pyvers, str):
         return split_pyvers(pyvers)
     elif isinstance(pyvers, list):
         norm_pyvers = []
 
         for pyver in pyvers:
-            if isinstance(pyver, six.string_types):
+            if isinstance(pyver, str):
                 norm_pyvers.append(pyver)
             else:
                 sys.stderr.write('%r in %s is a %s, not a string! Skipping.\n'
@@ -90,13 +125,72 @@ def _load_ini_pyvers(config_path):
         The list of Python versions. This will be ``None`` if versions could
         not be loaded.
     """
-    config_parser = RawConfigParser()
-    config_parser.read(config_path)
-
+    # Rather than parsing the whole file, this scans only as far as needed to
+    # find the pyvers option in the [pydo] section, falling back on one in
+    # [DEFAULT]. This handles the subset of INI syntax that's relevant:
+    # comments, "=" or ":" delimiters, case-insensitive option names, and
+    # continuation lines indented further than their option.
     try:
-        pyvers = config_parser.get('pydo', 'pyvers')
-    except (NoOptionError, NoSectionError):
-        pyvers = None
+        fp = open(config_path, 'r')
+    except OSError:
+        return None
+
+    section = None
+    has_pydo_section = False
+    option_indent = None
+    pyvers_section = None
+    section_pyvers = {}
+
+    with fp:
+        for line in fp:
+            norm_line = line.strip()
+
+            if not norm_line or norm_line[0] in '#;':
+                continue
+
+            indent = len(line) - len(line.lstrip())
+
+            if option_indent is not None and indent > option_indent:
+                if pyvers_section is not None:
+                    # This is a continuation of a pyvers value.
+                    section_pyvers[pyvers_section] = '%s %s' % (
+                        section_pyvers[pyvers_section], norm_line)
+
+                continue
+
+            if pyvers_section == 'pydo':
+                # We've reached the end of the [pydo] pyvers value.
+                break
+
+            pyvers_section = None
+
+            if norm_line[0] == '[':
+                section = norm_line[1:norm_line.find(']')]
+                option_indent = None
+
+                if section == 'pydo':
+                    has_pydo_section = True
+            else:
+                delim_positions = [
+                    _pos
+                    for _pos in (norm_line.find('='), norm_line.find(':'))
+                    if _pos != -1
+                ]
+
+                if delim_positions:
+                    delim_pos = min(delim_positions)
+                    option_indent = indent
+
+                    if (section in ('pydo', 'DEFAULT') and
+                        norm_line[:delim_pos].strip().lower() == 'pyvers'):
+                        pyvers_section = section
+                        section_pyvers[section] = \
+                            norm_line[delim_pos + 1:].strip()
+
+    if not has_pydo_section:
+        return None
+
+    pyvers = section_pyvers.get('pydo', section_pyvers.get('DEFAULT'))
 
     if not pyvers:
         return None
@@ -115,16 +209,12 @@ def _walk_parents(start_dir):
         str:
         The path to each directory.
     """
-    config_dir = start_dir
+    start_path = PurePath(start_dir)
 
-    while True:
-        yield config_dir
+    yield str(start_path)
 
-        config_dir, remain = os.path.split(config_dir)
-
-        if not remain:
-            # We've walked up to the root. Bail.
-            break
+    for parent_path in start_path.parents:
+        yield str(parent_path)
 
 
 def get_pyvers():
@@ -140,13 +230,51 @@ def get_pyvers():
 
     The first file with Python versions wins.
 
+    Results are cached for the current directory and virtual environment.
+
     Returns:
         list of str:
         The list of Python versions. This will be ``None`` if versions could
         not be loaded.
     """
     venv_path = os.environ.get('VIRTUAL_ENV')
+    cwd = os.getcwd()
+    cache_key = (cwd, venv_path)
+
+    try:
+        pyvers = _pyvers_cache[cache_key]
+    except KeyError:
+        if len(_pyvers_cache) >= _PYVERS_CACHE_MAX_SIZE:
+            _pyvers_cache.clear()
+
+        pyvers = _get_pyvers(cwd=cwd,
+                             venv_path=venv_path)
+        _pyvers_cache[cache_key] = pyvers
+
+    if pyvers is None:
+        return None
+
+    # Callers may modify the list, so hand back a copy.
+    return list(pyvers)
+
+
+def _get_pyvers(cwd, venv_path):
+    """Load a list of Python versions from configuration files.
+
+    This does the work for :py:func:`get_pyvers`.
+
+    Args:
+        cwd (str):
+            The current directory to search from.
+
+        venv_path (str):
+            The path to the active virtual environment, if any.
 
+    Returns:
+        list of str:
+        The list of Python versions. This will be ``None`` if versions could
+        not be loaded.
+    """
     if venv_path:
         venv_pydorc = os.path.join(venv_path, '.pydorc')
 
@@ -159,12 +287,17 @@ def get_pyvers():
         ('setup.cfg', _load_ini_pyvers),
     ]
 
-    for cur_dir in _walk_parents(os.getcwd()):
-        for config_filename, config_loader in config_filenames:
-            config_path = os.path.join(cur_dir, config_filename)
+    for cur_dir in _walk_parents(cwd):
+        # List each directory once, rather than checking for each config
+        # file separately.
+        try:
+            filenames = set(os.listdir(cur_dir))
+        except OSError:
+            continue
 
-            if os.path.exists(config_path):
-                pyvers = config_loader(config_path)
+        for config_filename, config_loader in config_filenames:
+            if config_filename in filenames:
+                pyvers = config_loader(os.path.join(cur_dir, config_filename))
 
                 if pyvers is not None:
                     return pyvers
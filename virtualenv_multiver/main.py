@@ -7,29 +7,33 @@
 # symlink for executing the build of Python. This symlink is tied to a
 # specific version of Python, and achieving cross-version support means
 # changing the reference in the python binary.
-from __future__ import unicode_literals
-
-import itertools
+import atexit
+import functools
+import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import timeit
+from contextlib import contextmanager
 from glob import glob
 
-try:
-    from virtualenv import mach_o_change
-except ImportError:
-    # This isn't running on macOS using the system Python install.
-    mach_o_change = None
-
 from virtualenv_multiver.config import get_pyvers
 from virtualenv_multiver.utils import norm_pyvers
 
 
 DEBUG = (os.getenv('DEBUG') == '1')
 
-PYTHON_VERSION_RE = re.compile(br'^Python (\d+)\.(\d+)')
+PYTHON_VERSION_RE = re.compile(r'^Python (\d+)\.(\d+)')
+
+MANIFEST_FILENAME = '.multiver-manifest.json'
+
+PROBE_CACHE_PATH = os.path.join(
+    os.path.expanduser(os.getenv('XDG_CACHE_HOME') or '~/.cache'),
+    'virtualenv-multiver',
+    'probe.json')
 
 DEFAULT_SCRIPTS = [
     'easy_install%s',
@@ -43,6 +47,18 @@ DEFAULT_SCRIPTS = [
     'wheel%s',
 ]
 
+# The permissions for newly-written files, based on the umask. Reading the
+# umask means temporarily changing it for the whole process, so it's only
+# done once, when this module is loaded.
+_umask = os.umask(0o022)
+os.umask(_umask)
+NEW_FILE_MODE = 0o666 & ~_umask
+
+
+_probe_cache = None
+_shebang_cache = {}
+_probe_cache_dirty = False
+
 
 def debug(text):
     """Log a debug message to the console.
@@ -55,50 +71,360 @@ def debug(text):
         print(text)
 
 
-def patch_default_scripts(bin_path, script_suffix, python_bin_name):
-    """Patch a set of default scripts for a given version of Python.
+@functools.lru_cache(maxsize=32)
+def format_script_names(script_suffix):
+    """Return the names of the default scripts for a suffix.
+
+    Results are cached for future lookup.
+
+    Args:
+        script_suffix (unicode):
+            The suffix for the script filenames.
+
+    Returns:
+        tuple of unicode:
+        The script filenames, in the order listed in ``DEFAULT_SCRIPTS``.
+    """
+    return tuple(
+        script_name % script_suffix
+        for script_name in DEFAULT_SCRIPTS
+    )
+
+
+def get_bin_entries(bin_path):
+    """Return the names of all entries in a bin directory.
+
+    This lists the directory once, so that checks for many scripts and
+    binaries don't each need to access the filesystem.
+
+    Args:
+        bin_path (unicode):
+            The path to the virtualenv's bin directory.
+
+    Returns:
+        set of unicode:
+        The names of all files, symlinks, and directories in the directory.
+    """
+    try:
+        return set(os.listdir(bin_path))
+    except OSError:
+        return set()
+
+
+def patch_all_default_scripts(bin_path, targets, bin_entries=None):
+    """Patch default scripts for several script suffixes in one pass.
 
     This will replace the ``#!/path/to/python` line for any matched scripts
-    with a version that points to the provided Python interpreter.
+    with a version that points to the Python interpreter for the script's
+    suffix. Each script is read and patched at most once.
 
     Args:
         bin_path (unicode):
             The path to the virtualenv's bin directory.
 
-        script_suffix (unicode):
-            The suffix for the script filename to patch.
+        targets (list of tuple):
+            A list of ``(script_suffix, python_bin_name)`` tuples. If more
+            than one target matches the same script, the last one wins.
 
-        python_bin_name (unicode):
-            The name of the Python interpreter to put into the shebang.
+        bin_entries (set of unicode, optional):
+            The names of the entries in the bin directory, as returned by
+            :py:func:`get_bin_entries`. If not provided, the directory will
+            be listed.
     """
-    expected_shebang = (
-        '#!%s'
-        % os.path.abspath(os.path.join(bin_path, python_bin_name))
-    )
+    if bin_entries is None:
+        bin_entries = get_bin_entries(bin_path)
+
+    scripts_to_patch = {}
+
+    for script_suffix, python_bin_name in targets:
+        try:
+            expected_shebang = _shebang_cache[(bin_path, python_bin_name)]
+        except KeyError:
+            expected_shebang = (
+                '#!%s'
+                % os.path.abspath(os.path.join(bin_path, python_bin_name))
+            ).encode('utf-8')
+            _shebang_cache[(bin_path, python_bin_name)] = expected_shebang
+
+        for script_filename in format_script_names(script_suffix):
+            if script_filename in bin_entries:
+                scripts_to_patch[script_filename] = (python_bin_name,
+                                                     expected_shebang)
+
+    for script_filename, patch_info in scripts_to_patch.items():
+        python_bin_name, expected_shebang = patch_info
+        script_path = os.path.join(bin_path, script_filename)
+
+        try:
+            fp = open(script_path, 'rb')
+        except OSError:
+            # This is a dangling symlink or otherwise unreadable.
+            continue
+
+        with fp:
+            # Only the shebang line is needed to see if this script must
+            # be patched.
+            shebang = fp.readline()
+            norm_shebang = shebang.rstrip()
+
+            if norm_shebang == expected_shebang:
+                continue
+
+            debug('Patching %s for %s' % (script_path, python_bin_name))
+
+            # This shebang needs to be updated. Make sure we're preserving
+            # the line ending so we don't break anything.
+            ending = shebang[len(norm_shebang):]
+
+            # Stream the rest of the script into a new file, and then
+            # move it into place.
+            with tempfile.NamedTemporaryFile(
+                    mode='wb',
+                    dir=bin_path,
+                    delete=False) as new_fp:
+                new_fp.write(expected_shebang)
+                new_fp.write(ending)
+                shutil.copyfileobj(fp, new_fp)
+
+        shutil.copystat(script_path, new_fp.name)
+        os.replace(new_fp.name, script_path)
+
+
+def get_interpreter_names(version):
+    """Return the interpreter names for a version of Python.
 
-    scripts_to_patch = (
-        os.path.join(bin_path, script_name % script_suffix)
-        for script_name in DEFAULT_SCRIPTS
-    )
+    Args:
+        version (unicode):
+            The Python version (e.g., "2.7", "3.6", "pypy3").
+
+    Returns:
+        tuple:
+        A 3-tuple of results:
+
+        Tuple:
+            0 (unicode):
+                The major version of Python.
+
+            1 (unicode):
+                The name of the ``pythonX`` binary.
+
+            2 (unicode):
+                The name of the ``pythonX.Y`` binary.
+    """
+    if version.startswith('pypy'):
+        if version == 'pypy':
+            major_version = '2'
+        else:
+            major_version = version[4:]
+
+        return major_version, version, version
+    else:
+        major_version = version[0]
+
+        return (major_version,
+                'python%s' % major_version,
+                'python%s' % version)
+
+
+def create_virtualenvs(path, versions):
+    """Create staging virtualenvs for each version of Python in parallel.
+
+    virtualenv writes to the whole tree, so each version is installed into
+    its own new staging directory alongside the destination. All the
+    virtualenv processes are started up-front and then waited on, letting
+    their interpreter setup and package installation overlap.
+
+    If only one version is being installed, there's nothing to overlap, so
+    virtualenv is run in-process (if it provides :py:func:`cli_run`) to
+    avoid starting another Python process.
+
+    If any virtualenv can't be created, the staging directories created
+    here are removed and the process exits with an error.
+
+    Args:
+        path (unicode):
+            The path to the destination virtualenv.
+
+        versions (list of unicode):
+            The list of Python versions to install.
+
+    Returns:
+        dict:
+        A dictionary mapping Python versions to staging virtualenv paths.
+    """
+    abs_path = os.path.abspath(path)
+    parent_path = os.path.dirname(abs_path)
+    cli_run = None
+    processes = []
+    staging_paths = {}
+    failed_python_bins = []
+
+    if len(versions) == 1:
+        try:
+            # virtualenv 20+
+            from virtualenv import cli_run
+        except ImportError:
+            # This is an older virtualenv, which must be run as a command.
+            pass
+
+    for version in versions:
+        # This is a new, uniquely-named directory, so that nothing that
+        # already exists alongside the destination is touched.
+        staging_path = tempfile.mkdtemp(
+            prefix='%s.tmp-%s-' % (os.path.basename(abs_path), version),
+            dir=parent_path)
+        staging_paths[version] = staging_path
+        pythonxy_bin = get_interpreter_names(version)[2]
+
+        debug('Creating staging virtualenv %s' % staging_path)
+
+        if cli_run is not None:
+            start = timeit.default_timer()
+
+            try:
+                session = cli_run(['-p', pythonxy_bin, staging_path])
+            except Exception as e:
+                sys.stderr.write('Unable to create a virtualenv for %s: %s\n'
+                                 % (pythonxy_bin, e))
+                failed_python_bins.append(pythonxy_bin)
+            else:
+                # Show the same report that the virtualenv command does.
+                try:
+                    from virtualenv.__main__ import LogSession
+                    report = LogSession(session, start)
+                except ImportError:
+                    report = 'created virtual environment %s' % (
+                        session.creator)
+
+                print(report)
+                sys.stdout.flush()
+
+            continue
+
+        try:
+            p = subprocess.Popen(
+                ['virtualenv', '-p', pythonxy_bin, staging_path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT)
+        except OSError as e:
+            sys.stderr.write('Unable to create a virtualenv for %s: %s\n'
+                             % (pythonxy_bin, e))
+            failed_python_bins.append(pythonxy_bin)
+            continue
+
+        processes.append((version, pythonxy_bin, staging_path, p))
+
+    stdout = sys.stdout.buffer
+
+    for version, pythonxy_bin, staging_path, p in processes:
+        stdout.write(p.communicate()[0])
+        stdout.flush()
+
+        if p.returncode != 0:
+            sys.stderr.write('Unable to create a virtualenv for %s: '
+                             'virtualenv exited with code %s\n'
+                             % (pythonxy_bin, p.returncode))
+            failed_python_bins.append(pythonxy_bin)
+
+    if failed_python_bins:
+        for staging_path in staging_paths.values():
+            shutil.rmtree(staging_path, ignore_errors=True)
+
+        sys.stderr.write('Your virtual environment was not changed.\n')
+        sys.exit(1)
 
-    for script_path in scripts_to_patch:
-        if os.path.exists(script_path):
-            with open(script_path, 'r') as fp:
-                lines = fp.read().splitlines(True)
+    return staging_paths
+
+
+def relocate_virtualenv(staging_path, path):
+    """Point a staging virtualenv's files at a new path.
+
+    virtualenv writes the absolute path and name of the virtualenv into the
+    activation scripts and :file:`pyvenv.cfg`, and (depending on the version
+    of virtualenv) other generated files, such as :file:`activate_this.py`
+    or :file:`*.pth` files. Any text file in the tree that references the
+    staging path is rewritten to refer to the final virtualenv path.
+
+    Args:
+        staging_path (unicode):
+            The path to the staging virtualenv.
+
+        path (unicode):
+            The path to the destination virtualenv.
+    """
+    replacements = [
+        (os.fsencode(os.path.abspath(staging_path)),
+         os.fsencode(os.path.abspath(path))),
+        (os.fsencode(os.path.basename(os.path.abspath(staging_path))),
+         os.fsencode(os.path.basename(os.path.abspath(path)))),
+    ]
 
-            shebang = lines[0]
-            norm_shebang = shebang.strip()
+    for dirpath, dirnames, filenames in os.walk(staging_path):
+        # Compiled bytecode is fixed up by Python when imported from a new
+        # location, so it can be left alone.
+        if '__pycache__' in dirnames:
+            dirnames.remove('__pycache__')
 
-            if norm_shebang != expected_shebang:
-                debug('Patching %s for %s' % (script_path, python_bin_name))
+        for filename in filenames:
+            candidate_path = os.path.join(dirpath, filename)
 
-                # This shebang needs to be updated. Make sure we're preserving
-                # the line ending so we don't break anything.
-                ending = shebang[len(norm_shebang):]
+            if (filename.endswith('.pyc') or
+                os.path.islink(candidate_path)):
+                continue
+
+            try:
+                with open(candidate_path, 'rb') as fp:
+                    data = fp.read()
+            except OSError:
+                continue
+
+            if b'\0' in data or replacements[0][0] not in data:
+                # This is either a binary or doesn't reference the staging
+                # path.
+                continue
+
+            debug('Relocating %s' % candidate_path)
+
+            for old, new in replacements:
+                data = data.replace(old, new)
+
+            atomic_write(candidate_path, data, mode='wb')
+
+
+def merge_tree(src_path, dest_path):
+    """Move the contents of one directory tree into another.
+
+    Directories present in both trees are merged. Any other existing files,
+    symlinks, or directories in the destination are replaced.
+
+    Args:
+        src_path (unicode):
+            The path to the directory to move from.
+
+        dest_path (unicode):
+            The path to the directory to move into.
+    """
+    if not os.path.isdir(dest_path):
+        os.makedirs(dest_path, 0o755)
 
-                with open(script_path, 'w') as fp:
-                    fp.write('%s%s' % (expected_shebang, ending))
-                    fp.write(''.join(lines[1:]))
+    for filename in os.listdir(src_path):
+        src_file_path = os.path.join(src_path, filename)
+        dest_file_path = os.path.join(dest_path, filename)
+        dest_is_dir = (os.path.isdir(dest_file_path) and
+                       not os.path.islink(dest_file_path))
+
+        if (dest_is_dir and
+            os.path.isdir(src_file_path) and
+            not os.path.islink(src_file_path)):
+            merge_tree(src_file_path, dest_file_path)
+            continue
+
+        if dest_is_dir:
+            shutil.rmtree(dest_file_path)
+        elif os.path.lexists(dest_file_path):
+            os.unlink(dest_file_path)
+
+        os.rename(src_file_path, dest_file_path)
 
 
 def symlink(source_path, dest_path):
@@ -111,14 +437,76 @@ def symlink(source_path, dest_path):
         dest_path (unicode):
             The path of the symlink.
     """
+    debug('Symlinking %s -> %s' % (source_path, dest_path))
+
+    # Create the symlink under a temporary name and move it over any
+    # existing file. This replaces the file atomically.
+    tmp_path = '%s.new' % dest_path
+
     try:
-        os.unlink(dest_path)
+        os.symlink(source_path, tmp_path)
     except OSError:
-        pass
+        # There's a stale temporary symlink from a previous run.
+        os.unlink(tmp_path)
+        os.symlink(source_path, tmp_path)
 
-    debug('Symlinking %s -> %s' % (source_path, dest_path))
+    os.replace(tmp_path, dest_path)
+
+
+def atomic_write(path, data, mode='w'):
+    """Atomically write the contents of a file.
+
+    The data is written to a temporary file in the same directory, which is
+    then moved into place. Readers will see either the old or new file, and
+    never a partially-written one. An existing file's permissions are kept.
+
+    Args:
+        path (unicode):
+            The path to the file to write.
+
+        data (unicode or bytes):
+            The data to write.
+
+        mode (unicode, optional):
+            The mode to open the file with. This should be ``w`` or ``wb``.
+    """
+    with tempfile.NamedTemporaryFile(mode=mode,
+                                     dir=os.path.dirname(path) or '.',
+                                     delete=False) as fp:
+        try:
+            fp.write(data)
+        except Exception:
+            os.unlink(fp.name)
+            raise
+
+    try:
+        shutil.copymode(path, fp.name)
+    except OSError:
+        # This is a new file. Use the default permissions instead of the
+        # temporary file's restricted ones.
+        os.chmod(fp.name, NEW_FILE_MODE)
+
+    os.replace(fp.name, path)
 
-    os.symlink(source_path, dest_path)
+
+@contextmanager
+def pushd(path):
+    """Temporarily change the current directory.
+
+    Context:
+        The current directory will be set to the path.
+
+    Args:
+        path (unicode):
+            The path to change to.
+    """
+    old_cwd = os.getcwd()
+    os.chdir(path)
+
+    try:
+        yield
+    finally:
+        os.chdir(old_cwd)
 
 
 def convert_symlink(bin_path, symlink_path):
@@ -145,15 +533,117 @@ def convert_symlink(bin_path, symlink_path):
     os.unlink(symlink_path)
 
     if os.path.isdir(link_target):
-        os.mkdir(symlink_path, 0o755)
+        # This tree is usually owned by the system's Python install, so it
+        # must be copied. Anything modified in the virtualenv would
+        # otherwise modify the system's files as well.
         shutil.copytree(link_target, symlink_path)
     else:
+        # This may be patched in place (such as by mach_o_change), so it
+        # must always be a real copy.
         shutil.copy(link_target, symlink_path)
 
 
+def load_probe_cache():
+    """Return the cache of results from probing Python interpreters.
+
+    The cache is loaded from disk the first time this is called, and will be
+    written back when the process exits if any new results were stored.
+
+    Returns:
+        dict:
+        A dictionary mapping interpreter paths to cached probe results.
+    """
+    global _probe_cache
+
+    if _probe_cache is None:
+        try:
+            with open(PROBE_CACHE_PATH, 'r') as fp:
+                _probe_cache = json.load(fp)
+        except (OSError, ValueError):
+            _probe_cache = {}
+
+        if not isinstance(_probe_cache, dict):
+            _probe_cache = {}
+
+        atexit.register(save_probe_cache)
+
+    return _probe_cache
+
+
+def save_probe_cache():
+    """Write the cache of interpreter probe results to disk.
+
+    Failures are ignored, since the cache is only an optimization.
+    """
+    if not _probe_cache_dirty:
+        return
+
+    try:
+        cache_dir = os.path.dirname(PROBE_CACHE_PATH)
+
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir, 0o755)
+
+        atomic_write(PROBE_CACHE_PATH, json.dumps(_probe_cache))
+    except OSError as e:
+        debug('Unable to write %s: %s' % (PROBE_CACHE_PATH, e))
+
+
+def probe_python(python_bin, probe_name, probe_func):
+    """Return a cached result for probing a Python interpreter.
+
+    Results are keyed off the interpreter's absolute path, modification time,
+    and size, so that a changed interpreter is probed again. Results are
+    persisted across runs.
+
+    Args:
+        python_bin (unicode):
+            The path to the :file:`python` binary to probe.
+
+        probe_name (unicode):
+            The name of the probe result to look up.
+
+        probe_func (callable):
+            The function to call to compute the result if not cached. This
+            takes no arguments.
+
+    Returns:
+        object:
+        The result of the probe.
+    """
+    global _probe_cache_dirty
+
+    try:
+        st = os.stat(python_bin)
+    except OSError:
+        return probe_func()
+
+    cache_key = os.path.abspath(python_bin)
+    stat_key = [st.st_mtime_ns, st.st_size]
+    probe_cache = load_probe_cache()
+    entry = probe_cache.get(cache_key)
+
+    if not isinstance(entry, dict) or entry.get('stat') != stat_key:
+        entry = {
+            'stat': stat_key,
+        }
+        probe_cache[cache_key] = entry
+
+    try:
+        return entry[probe_name]
+    except KeyError:
+        result = probe_func()
+        entry[probe_name] = result
+        _probe_cache_dirty = True
+
+        return result
+
+
 def get_python_version(python_bin):
     """Return the Python major.minor version parsed from an interpreter.
 
+    Results are cached across runs.
+
     Args:
         python_bin (unicode):
             The path to the :file:`python` binary to execute.
@@ -162,31 +652,29 @@ def get_python_version(python_bin):
         unicode:
         The "<major>.<minor>" version.
     """
-    try:
-        parsed_version = subprocess.check_output(
-            [python_bin, '--version'],
-            stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
-        sys.stderr.write('Failed to call %s --version: %s\n'
-                         % (python_bin, e))
-        sys.stderr.write('Your virtual environment is incomplete.\n')
-        sys.exit(1)
-
-    m = PYTHON_VERSION_RE.search(parsed_version)
+    def _probe():
+        try:
+            parsed_version = subprocess.check_output(
+                [python_bin, '--version'],
+                stderr=subprocess.STDOUT,
+                universal_newlines=True)
+        except subprocess.CalledProcessError as e:
+            sys.stderr.write('Failed to call %s --version: %s\n'
+                             % (python_bin, e))
+            sys.stderr.write('Your virtual environment is incomplete.\n')
+            sys.exit(1)
 
-    if not m:
-        sys.stderr.write('Unable to parse Python version from "%s"\n'
-                         % parsed_version)
-        sys.stderr.write('Your virtual environment is incomplete.\n')
-        sys.exit(1)
+        m = PYTHON_VERSION_RE.search(parsed_version)
 
-    return '%s.%s' % m.groups()
+        if not m:
+            sys.stderr.write('Unable to parse Python version from "%s"\n'
+                             % parsed_version)
+            sys.stderr.write('Your virtual environment is incomplete.\n')
+            sys.exit(1)
 
+        return '%s.%s' % m.groups()
 
-def get_site_py_path(python_bin):
-    return subprocess.check_output(
-        [python_bin, '-c', 'import site; print(site.__file__)']
-    ).strip()
+    return probe_python(python_bin, 'version', _probe)
 
 
 def update_pyvenv(venv_path, priv_bin_path, python_version):
@@ -217,22 +705,39 @@ def update_pyvenv(venv_path, priv_bin_path, python_version):
         os.path.join(venv_path, 'lib-python', python_version, 'site.py'),
     ]
 
+    old_pyvenv_ref = '{}pyvenv.cfg"'
+    new_pyvenv_ref = '{}%s/pyvenv.cfg"' % os.path.basename(priv_bin_path)
+
     for site_py_path in site_py_paths:
         if os.path.exists(site_py_path):
-            debug('Patching %s' % site_py_path)
-
-            with open(site_py_path, 'r') as fp:
-                data = fp.read()
-
-            data = data.replace(
-                '{}pyvenv.cfg"',
-                '{}%s/pyvenv.cfg"' % os.path.basename(priv_bin_path))
-
-            with open(site_py_path, 'w') as fp:
-                fp.write(data)
+            # Stream the patched file into a temporary file, which will be
+            # moved into place only if anything changed.
+            changed = False
+
+            with open(site_py_path, 'r') as src_fp:
+                with tempfile.NamedTemporaryFile(
+                        mode='w',
+                        dir=os.path.dirname(site_py_path),
+                        delete=False) as dest_fp:
+                    for line in src_fp:
+                        if old_pyvenv_ref in line:
+                            line = line.replace(old_pyvenv_ref,
+                                                new_pyvenv_ref)
+                            changed = True
+
+                        dest_fp.write(line)
+
+            if changed:
+                debug('Patching %s' % site_py_path)
+
+                shutil.copystat(site_py_path, dest_fp.name)
+                os.replace(dest_fp.name, site_py_path)
+            else:
+                os.unlink(dest_fp.name)
 
 
-def create_versioned_symlinks(bin_path, major_py_bins, major_py_latest):
+def create_versioned_symlinks(bin_path, major_py_bins, major_py_latest,
+                              bin_entries=None):
     """Create versioned symlinks for the Python binaries and scripts.
 
     This will create ``bin`` and ``binX`` symlinks for all installed versions
@@ -250,46 +755,56 @@ def create_versioned_symlinks(bin_path, major_py_bins, major_py_latest):
             A dictionary mapping major Python versions to the latest
             specified version in that series.
 
-        has_pypy (bool, optional):
-            Whether there's a pypy version being installed.
+        bin_entries (set of unicode, optional):
+            The names of the entries in the bin directory, as returned by
+            :py:func:`get_bin_entries`. If not provided, the directory will
+            be listed. This will be updated as symlinks are created.
     """
-    # Add python and pythonX symlinks for the last-specified major versions.
-    for major_ver, pythonxy_bin in major_py_bins.items():
-        symlink(pythonxy_bin, os.path.join(bin_path, 'python%s' % major_ver))
+    if bin_entries is None:
+        bin_entries = get_bin_entries(bin_path)
+
+    with pushd(bin_path):
+        # Add python and pythonX symlinks for the last-specified major
+        # versions.
+        for major_ver, pythonxy_bin in major_py_bins.items():
+            pythonx_bin = 'python%s' % major_ver
 
-    # Add script and scriptX symlinks for the last-specified major versions.
-    for major_ver, latest_ver in major_py_latest.items():
-        for script_name_fmt in DEFAULT_SCRIPTS:
-            script_x_filename = script_name_fmt % major_ver
-            script_xy_filename = script_name_fmt % latest_ver
+            symlink(pythonxy_bin, pythonx_bin)
+            bin_entries.add(pythonx_bin)
 
-            if os.path.exists(os.path.join(bin_path, script_xy_filename)):
-                symlink(script_xy_filename,
-                        os.path.join(bin_path, script_x_filename))
+        # Add script and scriptX symlinks for the last-specified major
+        # versions.
+        for major_ver, latest_ver in major_py_latest.items():
+            script_filenames = zip(format_script_names(major_ver),
+                                   format_script_names(latest_ver))
 
-    # Set the main 'python' binary to something useful. It *should* point to
-    # python2, if installed. Otherwise, point it to the next version up.
-    for major_ver in ('2', '3', '4'):
-        if major_ver in major_py_bins:
-            python_bin = major_py_bins[major_ver]
+            for script_x_filename, script_xy_filename in script_filenames:
+                if script_xy_filename in bin_entries:
+                    symlink(script_xy_filename, script_x_filename)
+                    bin_entries.add(script_x_filename)
 
-            symlink('python%s' % major_ver,
-                    os.path.join(bin_path, 'python'))
+        # Set the main 'python' binary to something useful. It *should* point
+        # to python2, if installed. Otherwise, point it to the next version
+        # up.
+        for major_ver in ('2', '3', '4'):
+            if major_ver in major_py_bins:
+                python_bin = major_py_bins[major_ver]
 
-            if os.path.basename(python_bin).startswith('pypy'):
-                symlink('pypy%s' % major_ver,
-                        os.path.join(bin_path, 'pypy'))
+                symlink('python%s' % major_ver, 'python')
 
-            for script_name_fmt in DEFAULT_SCRIPTS:
-                script_filename = script_name_fmt % ''
-                script_x_filename = script_name_fmt % major_ver
+                if os.path.basename(python_bin).startswith('pypy'):
+                    symlink('pypy%s' % major_ver, 'pypy')
 
-                if (not script_filename.endswith('-') and
-                    os.path.exists(os.path.join(bin_path, script_x_filename))):
-                    symlink(script_x_filename,
-                            os.path.join(bin_path, script_filename))
+                script_filenames = zip(format_script_names(''),
+                                       format_script_names(major_ver))
 
-            break
+                for script_filename, script_x_filename in script_filenames:
+                    if (not script_filename.endswith('-') and
+                        script_x_filename in bin_entries):
+                        symlink(script_x_filename, script_filename)
+                        bin_entries.add(script_filename)
+
+                break
 
 
 def create_pydorc(venv_path):
@@ -307,9 +822,105 @@ def create_pydorc(venv_path):
         ),
         key=make_version_sort_key)
 
-    with open(os.path.join(venv_path, '.pydorc'), 'w') as fp:
-        fp.write('[pydo]\n')
-        fp.write('pyvers=%s\n' % ' '.join(versions))
+    atomic_write(os.path.join(venv_path, '.pydorc'),
+                 '[pydo]\npyvers=%s\n' % ' '.join(versions))
+
+
+def load_manifest(venv_path):
+    """Load the manifest of installed versions in a virtualenv.
+
+    Args:
+        venv_path (unicode):
+            The path to the virtualenv.
+
+    Returns:
+        dict:
+        A dictionary mapping installed Python versions to the modification
+        times (in nanoseconds) of the interpreters they were installed from.
+        This will be empty if there's no valid manifest.
+    """
+    try:
+        with open(os.path.join(venv_path, MANIFEST_FILENAME), 'r') as fp:
+            manifest = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(manifest, dict):
+        return {}
+
+    return manifest
+
+
+def save_manifest(venv_path, manifest):
+    """Write the manifest of installed versions in a virtualenv.
+
+    Args:
+        venv_path (unicode):
+            The path to the virtualenv.
+
+        manifest (dict):
+            A dictionary mapping installed Python versions to the
+            modification times (in nanoseconds) of the interpreters they were
+            installed from.
+    """
+    atomic_write(os.path.join(venv_path, MANIFEST_FILENAME),
+                 json.dumps(manifest, indent=2, sort_keys=True))
+
+
+def get_interpreter_mtime(python_bin_name):
+    """Return the modification time of an interpreter in the search path.
+
+    Args:
+        python_bin_name (unicode):
+            The name of the Python interpreter (e.g., "python3.8").
+
+    Returns:
+        int:
+        The modification time of the interpreter in nanoseconds. This will
+        be ``None`` if the interpreter couldn't be found.
+    """
+    python_bin = shutil.which(python_bin_name)
+
+    if not python_bin:
+        return None
+
+    try:
+        return os.stat(python_bin).st_mtime_ns
+    except OSError:
+        return None
+
+
+def is_version_installed(venv_path, version, bin_entries):
+    """Return whether a version of Python is set up in a virtualenv.
+
+    This checks for the private interpreter and the link to it in
+    :file:`bin`.
+
+    Args:
+        venv_path (unicode):
+            The path to the virtualenv.
+
+        version (unicode):
+            The Python version.
+
+        bin_entries (set of unicode):
+            The names of the entries in the bin directory, as returned by
+            :py:func:`get_bin_entries`.
+
+    Returns:
+        bool:
+        ``True`` if the version appears to be fully installed.
+    """
+    pythonxy_bin = get_interpreter_names(version)[2]
+
+    if pythonxy_bin == 'pypy':
+        linked_bin = 'pypy2'
+    else:
+        linked_bin = pythonxy_bin
+
+    return (linked_bin in bin_entries and
+            os.path.exists(os.path.join(venv_path, '.bin-%s' % version,
+                                        pythonxy_bin)))
 
 
 def make_version_sort_key(version):
@@ -348,6 +959,7 @@ def main():
                           key=make_version_sort_key)
 
     path = sys.argv[1]
+    abs_path = os.path.abspath(path)
 
     bin_path = os.path.join(path, 'bin')
     lib_path = os.path.join(path, 'lib')
@@ -386,35 +998,73 @@ def main():
         sys.stderr.write('%s\n' % e)
         sys.exit(1)
 
-    print('Installing virtual environments for %s' % ', '.join(versions))
+    # Check which versions were already installed by a previous run, from
+    # interpreters that haven't since changed. Those can be skipped.
+    manifest = load_manifest(path)
+    bin_entries = get_bin_entries(bin_path)
+    interpreter_mtimes = {}
+    new_versions = []
+
+    for version in versions:
+        interpreter_mtime = \
+            get_interpreter_mtime(get_interpreter_names(version)[2])
+        interpreter_mtimes[version] = interpreter_mtime
+
+        if (interpreter_mtime is None or
+            manifest.get(version) != interpreter_mtime or
+            not is_version_installed(path, version, bin_entries)):
+            new_versions.append(version)
+
+    installed_versions = [
+        version
+        for version in versions
+        if version not in new_versions
+    ]
+
+    if installed_versions:
+        print('Virtual environments are up-to-date for %s'
+              % ', '.join(installed_versions))
+
+    if new_versions:
+        print('Installing virtual environments for %s'
+              % ', '.join(new_versions))
+
+    # Create all the virtualenvs in parallel. Each is built in a staging
+    # directory, and then merged into the main virtualenv one at a time below.
+    staging_paths = create_virtualenvs(path, new_versions)
 
     # Begin building the virtualenvs.
     for version in versions:
         is_pypy = version.startswith('pypy')
-
-        if is_pypy:
-            if version == 'pypy':
-                major_version = '2'
+        major_version, pythonx_bin, pythonxy_bin = \
+            get_interpreter_names(version)
+
+        if version in installed_versions:
+            # This version is already set up. We just need its metadata for
+            # script generation.
+            if is_pypy:
+                python_version = get_python_version(
+                    os.path.join(abs_path, '.bin-%s' % version, pythonxy_bin))
             else:
-                major_version = version[4:]
+                python_version = version
 
-            pythonxy_bin = version
-            pythonx_bin = version
-        else:
-            major_version = version[0]
-            pythonxy_bin = 'python%s' % version
-            pythonx_bin = 'python%s' % major_version
+            if pythonxy_bin == 'pypy':
+                pythonxy_bin = 'pypy2'
+
+            major_py_bins[major_version] = pythonxy_bin
+            major_py_latest[major_version] = python_version
+            continue
 
         # Install this version of Python into the virtualenv.
-        subprocess.call(['virtualenv', '-p', pythonxy_bin, path])
+        staging_path = staging_paths[version]
 
-        pythonxy_bin_path = os.path.join(bin_path, pythonxy_bin)
+        relocate_virtualenv(staging_path, path)
+        merge_tree(staging_path, path)
+        shutil.rmtree(staging_path)
 
-        # Get the version of Python.
-        if is_pypy:
-            python_version = get_python_version(pythonxy_bin_path)
-        else:
-            python_version = version
+        root_entries = set(os.listdir(path))
+
+        pythonxy_bin_path = os.path.join(bin_path, pythonxy_bin)
 
         # If pythonX.Y is a symlink, we'll need to turn it into a proper
         # executable.
@@ -429,8 +1079,7 @@ def main():
 
         # Move the interpreter into a private version-specific bin directory,
         # where we'll be able to put the pyvenv.cfg.
-        priv_bin_path = os.path.join(os.path.abspath(path),
-                                     '.bin-%s' % version)
+        priv_bin_path = os.path.join(abs_path, '.bin-%s' % version)
         priv_pythonxy_bin = os.path.join(priv_bin_path, pythonxy_bin)
 
         if not os.path.exists(priv_bin_path):
@@ -443,6 +1092,14 @@ def main():
             for libpypy_filename in glob(os.path.join(bin_path, 'libpypy*')):
                 shutil.move(libpypy_filename, priv_bin_path)
 
+        # Get the version of Python. This probes the interpreter at its
+        # final location, so the result is cached under the same path used
+        # when the version is already installed.
+        if is_pypy:
+            python_version = get_python_version(priv_pythonxy_bin)
+        else:
+            python_version = version
+
         if pythonxy_bin == 'pypy':
             # PyPy for Python 2.7 has its main binary as "pypy". Let's rename
             # that, so it can be installed in parallel with pypy3.
@@ -474,11 +1131,19 @@ def main():
         # patch the binary to point to a version-specific symlink.
         mac_python_link = os.path.join(path, '.Python')
 
-        if os.path.exists(mac_python_link):
+        if '.Python' in root_entries and os.path.exists(mac_python_link):
+            # virtualenv is slow to import, so only import this when needed.
+            try:
+                from virtualenv import mach_o_change
+            except ImportError:
+                # This isn't running on macOS using the system Python install.
+                mach_o_change = None
+
             # Note that the new path must be shorter than the old one, so we're
             # shortening to ".PyX.Y".
             new_mac_python_link = os.path.join(path, '.Py%s' % version)
             shutil.move(mac_python_link, new_mac_python_link)
+            root_entries.discard('.Python')
 
             orig_python_path = os.readlink(new_mac_python_link)
             old_python_exec_path = '@executable_path/../.Python'
@@ -501,32 +1166,40 @@ def main():
                         'tools.\n')
                     raise
 
-        bins_to_remove = [
-            os.path.join(bin_path, 'python'),
-            os.path.join(bin_path, 'pypy'),
-            os.path.join(path, '.Python'),
-        ] + list(itertools.chain.from_iterable([
-            (os.path.join(bin_path, script_name % ''),
-             os.path.join(bin_path, script_name % major_version))
-            for script_name in DEFAULT_SCRIPTS
-        ]))
+        bins_to_remove = (
+            ['python', 'pypy'] +
+            list(format_script_names('')) +
+            list(format_script_names(major_version))
+        )
 
         if is_pypy:
             python_lib_dir = os.path.join(path, 'lib-python',
                                           'python-%s' % python_version)
-            bins_to_remove.append(os.path.join(bin_path,
-                                               'python%s' % python_version))
+            bins_to_remove.append('python%s' % python_version)
         else:
             python_lib_dir = os.path.join(path, 'lib', 'python-%s' % version)
-            bins_to_remove.append(os.path.join(bin_path, pythonx_bin))
+            bins_to_remove.append(pythonx_bin)
+
+        # Only try to remove files that are actually present.
+        bin_entries = get_bin_entries(bin_path)
+        links_to_remove = [
+            os.path.join(bin_path, bin_name)
+            for bin_name in bins_to_remove
+            if bin_name in bin_entries
+        ]
+
+        if '.Python' in root_entries:
+            links_to_remove.append(mac_python_link)
 
-        for link_path in bins_to_remove:
+        for link_path in links_to_remove:
             try:
                 os.unlink(link_path)
                 debug('Removed %s' % link_path)
             except OSError:
                 pass
 
+        bin_entries.difference_update(bins_to_remove)
+
         # Update the path to all default scripts.
         #
         # We have three types we're updating (in this order):
@@ -535,24 +1208,32 @@ def main():
         # 2. The major-versioned scripts (pip2, pip3, easy_install2, etc.)
         # 3. The major.minor-versioned scripts (pip2.7, pip3.8,
         #    easy_install-2.7, etc.)
-        patch_default_scripts(bin_path=bin_path,
-                              script_suffix='',
-                              python_bin_name='python')
-        patch_default_scripts(bin_path=bin_path,
-                              script_suffix=version[0],
-                              python_bin_name=pythonx_bin)
-        patch_default_scripts(bin_path=bin_path,
-                              script_suffix=version,
-                              python_bin_name=pythonxy_bin)
+        patch_all_default_scripts(
+            bin_path=bin_path,
+            targets=[
+                ('', 'python'),
+                (version[0], pythonx_bin),
+                (version, pythonxy_bin),
+            ],
+            bin_entries=bin_entries)
 
     # Create symlinks for all the versions of the scripts and interpreters.
     create_versioned_symlinks(bin_path=bin_path,
                               major_py_bins=major_py_bins,
-                              major_py_latest=major_py_latest)
+                              major_py_latest=major_py_latest,
+                              bin_entries=get_bin_entries(bin_path))
 
     # Create a .pydorc file for pydo.
     create_pydorc(path)
 
+    # Record the installed versions, so they can be skipped next time.
+    manifest.update(
+        (version, interpreter_mtime)
+        for version, interpreter_mtime in interpreter_mtimes.items()
+        if interpreter_mtime is not None
+    )
+    save_manifest(path, manifest)
+
     # Create a single pyvenv.cfg for this virtualenv based on the last version
     # installed. This is still not ideal, because it's version-specific, but
     # in practice it should be okay.
@@ -564,7 +1245,6 @@ def main():
     # used. So we need to set that.
     symlink(
         os.path.relpath(
-            os.path.abspath(os.path.join(path, '.bin-%s' % versions[-1],
-                                         'pyvenv.cfg')),
-            path),
+            os.path.join(abs_path, '.bin-%s' % versions[-1], 'pyvenv.cfg'),
+            abs_path),
         os.path.join(path, 'pyvenv.cfg'))
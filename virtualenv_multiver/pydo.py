@@ -6,10 +6,14 @@ and for each version of Python.
 
 Usage::
 
-    $ pydo [<version> [<version> ...]] <command>
+    $ pydo [--fail-fast] [--jobs N] [<version> [<version> ...]] <command>
 
 Versions are in X.Y form, and can include ranges like ``3.8-3.10``.
 
+Commands are run in parallel, and the output of each is shown once it
+finishes. Use ``--jobs 1`` to run them one at a time, for commands that write
+to shared state (such as ``pip install -e .``).
+
 If you don't specify any versions, the Python versions available in the
 virtualenv-multiver environment will be used.
 
@@ -20,26 +24,36 @@ Version Added:
     2.1
 """
 
-from __future__ import print_function, unicode_literals
-
 import argparse
 import os
+import queue
 import re
+import selectors
 import subprocess
 import sys
+import threading
+from contextlib import closing
 
 from virtualenv_multiver.config import get_pyvers
 from virtualenv_multiver.utils import (norm_pyvers,
-                                       validate_pyvers,
+                                       validate_resolved,
                                        which)
 
 
 PYVER_RE = re.compile(r'^[23](\.\d+)?')
 
+# The maximum number of bytes to read from a command's output at a time.
+_READ_SIZE = 64 * 1024
+
 
 def build_pyver_commands(pyvers, command, command_args):
     """Build command lines used to run Python commands for multiple versions.
 
+    The ``pythonX.Y`` executable is looked up for every version, so that the
+    results can be checked with
+    :py:func:`~virtualenv_multiver.utils.validate_resolved`. Versions without
+    one won't have a command line.
+
     Args:
         pyvers (list of str):
             The normalized list of Python versions.
@@ -51,22 +65,40 @@ def build_pyver_commands(pyvers, command, command_args):
             The list of arguments to pass to each command.
 
     Returns:
-        list of tuple:
-        The list of command lines in the following form:
+        tuple:
+        A 2-tuple of results:
 
         Tuple:
-            0 (str):
-                The Python version to use.
+            0 (list of tuple):
+                The list of command lines in the following form:
 
-            1 (list of str):
-                The command line to run.
+                Tuple:
+                    0 (str):
+                        The Python version to use.
+
+                    1 (list of str):
+                        The command line to run.
+
+                    2 (str):
+                        The header to display before the command's output.
+
+            1 (dict):
+                A mapping of each Python version to the resolved path of its
+                ``pythonX.Y`` executable, or ``None`` if it wasn't found.
     """
     pyver_commands = []
+    resolved_pyvers = {}
+
+    for pyver in pyvers or []:
+        python_path = which(f'python{pyver}')
+        resolved_pyvers[pyver] = python_path
+
+        if not python_path:
+            continue
 
-    for pyver in pyvers:
         candidates = [
-            '%s%s' % (command, pyver),
-            '%s-%s' % (command, pyver),
+            f'{command}{pyver}',
+            f'{command}-{pyver}',
         ]
 
         for candidate in candidates:
@@ -76,35 +108,294 @@ def build_pyver_commands(pyvers, command, command_args):
                 pyver_command = [exe_path]
                 break
         else:
-            pyver_command = [which('python%s' % pyver), command]
+            pyver_command = [python_path, command]
 
-        pyver_commands.append((pyver, pyver_command + command_args))
+        pyver_command += command_args
 
-    return pyver_commands
+        header = (
+            '🐍 pydo: Python %s: %s'
+            % (pyver, subprocess.list2cmdline(pyver_command))
+        )
+        bar = '=' * len(header)
 
+        pyver_commands.append((pyver, pyver_command,
+                               '%s\n%s\n%s' % (bar, header, bar)))
 
-def run_pyver_command(pyver_command):
-    """Run a comamnd for a Python version.
+    return pyver_commands, resolved_pyvers
 
-    Output and errors will be streamed to the terminal.
+
+def start_pyver_command(pyver_command, capture=False, cwd=None, env=None):
+    """Start a command for a Python version.
 
     Args:
         pyver_command (list of str):
             The command line to run.
 
+        capture (bool, optional):
+            Whether to capture the output and errors in a single pipe,
+            rather than streaming them to the terminal.
+
+        cwd (str, optional):
+            The directory to run the command in. This defaults to the
+            current directory.
+
+        env (dict, optional):
+            The environment to run the command with. This defaults to the
+            current environment.
+
+    Returns:
+        subprocess.Popen:
+        The running process.
+    """
+    if capture:
+        stdout = subprocess.PIPE
+        stderr = subprocess.STDOUT
+    else:
+        stdout = sys.stdout
+        stderr = sys.stderr
+
+    return subprocess.Popen(pyver_command,
+                            stdin=subprocess.PIPE,
+                            stdout=stdout,
+                            stderr=stderr,
+                            shell=False,
+                            cwd=cwd,
+                            env=env)
+
+
+def _stop_process(p):
+    """Stop a running command and wait for it to exit.
+
+    Args:
+        p (subprocess.Popen):
+            The process to stop.
+    """
+    try:
+        p.terminate()
+    except OSError:
+        # The process has already exited.
+        pass
+
+    p.stdout.close()
+    p.wait()
+
+
+def _iter_finished_selector(pyver_commands, max_jobs, cwd, env):
+    """Run commands, yielding results as each finishes, using a selector.
+
+    A single selector waits on all of the commands' output pipes at once,
+    buffering what each command writes. This requires pipe support in
+    :py:mod:`selectors`, which isn't available on Windows.
+
+    Any commands still running when this stops (due to an error or the
+    generator being closed) will be terminated.
+
+    Args:
+        pyver_commands (list of tuple):
+            The list of commands, as returned by
+            :py:func:`build_pyver_commands`.
+
+        max_jobs (int):
+            The maximum number of commands to run at once, or ``None`` for
+            no limit.
+
+        cwd (str):
+            The directory to run the commands in.
+
+        env (dict):
+            The environment to run the commands with.
+
+    Yields:
+        tuple:
+        A 3-tuple of the command's index, result code, and output as bytes.
+    """
+    pending = iter(enumerate(pyver_commands))
+
+    with selectors.DefaultSelector() as selector:
+        try:
+            while True:
+                # Each running command has exactly one registered pipe.
+                while (max_jobs is None or
+                       len(selector.get_map()) < max_jobs):
+                    try:
+                        i, (pyver, pyver_command, header) = next(pending)
+                    except StopIteration:
+                        break
+
+                    p = start_pyver_command(pyver_command,
+                                            capture=True,
+                                            cwd=cwd,
+                                            env=env)
+                    p.stdin.close()
+                    os.set_blocking(p.stdout.fileno(), False)
+                    selector.register(p.stdout, selectors.EVENT_READ,
+                                      (i, p, bytearray()))
+
+                if not selector.get_map():
+                    break
+
+                for key, events in selector.select():
+                    i, p, output = key.data
+
+                    try:
+                        data = os.read(key.fd, _READ_SIZE)
+                    except BlockingIOError:
+                        continue
+
+                    if data:
+                        output += data
+                        continue
+
+                    # The command has closed its output, so it's done.
+                    selector.unregister(p.stdout)
+                    p.stdout.close()
+
+                    yield i, p.wait(), bytes(output)
+        finally:
+            for key in list(selector.get_map().values()):
+                p = key.data[1]
+                selector.unregister(p.stdout)
+                _stop_process(p)
+
+
+def _iter_finished_threaded(pyver_commands, max_jobs, cwd, env):
+    """Run commands, yielding results as each finishes, using threads.
+
+    Each command's output is collected by its own thread. This is used on
+    Windows, where :py:mod:`selectors` can't wait on pipes.
+
+    Any commands still running when this stops (due to an error or the
+    generator being closed) will be terminated.
+
+    Args:
+        pyver_commands (list of tuple):
+            The list of commands, as returned by
+            :py:func:`build_pyver_commands`.
+
+        max_jobs (int):
+            The maximum number of commands to run at once, or ``None`` for
+            no limit.
+
+        cwd (str):
+            The directory to run the commands in.
+
+        env (dict):
+            The environment to run the commands with.
+
+    Yields:
+        tuple:
+        A 3-tuple of the command's index, result code, and output as bytes.
+    """
+    def _communicate(i, p):
+        try:
+            output = p.communicate()[0]
+        except (OSError, ValueError):
+            # The pipe was closed while stopping the command.
+            output = b''
+
+        finished.put((i, p.returncode, output))
+
+    finished = queue.Queue()
+    pending = iter(enumerate(pyver_commands))
+    running = {}
+
+    try:
+        while True:
+            while max_jobs is None or len(running) < max_jobs:
+                try:
+                    i, (pyver, pyver_command, header) = next(pending)
+                except StopIteration:
+                    break
+
+                p = start_pyver_command(pyver_command,
+                                        capture=True,
+                                        cwd=cwd,
+                                        env=env)
+                running[i] = p
+
+                thread = threading.Thread(target=_communicate,
+                                          args=(i, p))
+                thread.daemon = True
+                thread.start()
+
+            if not running:
+                break
+
+            i, exit_code, output = finished.get()
+            del running[i]
+
+            yield i, exit_code, output
+    finally:
+        for p in running.values():
+            try:
+                p.terminate()
+            except OSError:
+                # The process has already exited.
+                pass
+
+            p.wait()
+
+
+def run_pyver_commands(pyver_commands, fail_fast=False, max_jobs=None,
+                       cwd=None, env=None):
+    """Run commands for multiple Python versions in parallel.
+
+    Commands are run concurrently, with their output and errors captured.
+    As each command finishes, its header and output are written to the
+    terminal as a block.
+
+    Args:
+        pyver_commands (list of tuple):
+            The list of commands, as returned by
+            :py:func:`build_pyver_commands`.
+
+        fail_fast (bool, optional):
+            Whether to stop all other commands and exit as soon as any
+            command fails.
+
+        max_jobs (int, optional):
+            The maximum number of commands to run at once. By default, all
+            commands are run at once.
+
+        cwd (str, optional):
+            The directory to run the commands in. This defaults to the
+            current directory.
+
+        env (dict, optional):
+            The environment to run the commands with. This defaults to the
+            current environment.
+
     Returns:
-        int:
-        The result code.
+        list of int:
+        The result codes, in the same order as the commands.
     """
-    p = subprocess.Popen(pyver_command,
-                         stdin=subprocess.PIPE,
-                         stdout=sys.stdout,
-                         stderr=sys.stderr,
-                         shell=False,
-                         cwd=os.getcwd(),
-                         env=os.environ)
+    if sys.platform == 'win32':
+        iter_finished = _iter_finished_threaded
+    else:
+        iter_finished = _iter_finished_selector
+
+    exit_codes = [None] * len(pyver_commands)
+    finished = iter_finished(pyver_commands,
+                             max_jobs=max_jobs,
+                             cwd=cwd,
+                             env=env)
+
+    # Closing the generator stops any commands that are still running.
+    with closing(finished):
+        for i, exit_code, output in finished:
+            exit_codes[i] = exit_code
+
+            sys.stdout.write(pyver_commands[i][2])
+            sys.stdout.write('\n')
+            sys.stdout.flush()
+
+            sys.stdout.buffer.write(output)
+            sys.stdout.buffer.flush()
+
+            if exit_code != 0 and fail_fast:
+                break
 
-    return p.wait()
+    return exit_codes
 
 
 def parse_args(argv):
@@ -138,6 +429,16 @@ def parse_args(argv):
         action='store_true',
         default=False,
         help='Fail immediately if any commands return a non-0 exit code.')
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=None,
+        metavar='N',
+        help=('The maximum number of commands to run at once. By default, '
+              'commands for all versions are run at once. Use 1 for '
+              'commands that write to shared state, such as '
+              '"pip install -e .".'))
     parser.add_argument(
         'pyver',
         type=str,
@@ -160,19 +461,42 @@ def parse_args(argv):
         nargs='*',
         help=('Arguments to pass to the command.'))
 
-    args, remaining_args = parser.parse_known_args(argv[1:])
+    # Only the options and versions before the command belong to pydo.
+    # Everything after the command is passed to it as-is, even if it looks
+    # like one of pydo's options.
+    pydo_argv = argv[1:]
+    match_pyver = PYVER_RE.match
+    command_index = 0
+
+    while command_index < len(pydo_argv):
+        arg = pydo_argv[command_index]
+
+        if arg in ('-j', '--jobs'):
+            # Skip the option's value as well.
+            command_index += 2
+        elif arg.startswith('-') or match_pyver(arg):
+            command_index += 1
+        else:
+            break
+
+    args, remaining_args = \
+        parser.parse_known_args(pydo_argv[:command_index + 1])
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
 
     # argparse will get all this wrong, since we've been bad and made a bunch
     # of variable-length optional arguments. Do a second round of parsing and
     # sort them into the right buckets.
-    combined_args = args.pyver + [args.command] + args.args + remaining_args
+    combined_args = (args.pyver + [args.command] + args.args +
+                     remaining_args + pydo_argv[command_index + 1:])
     pyvers = []
     command = None
     command_args = []
 
     for arg in combined_args:
         if command is None:
-            if PYVER_RE.match(arg):
+            if match_pyver(arg):
                 pyvers.append(arg)
             else:
                 command = arg
@@ -197,40 +521,49 @@ def main(argv=sys.argv):
                                              os.pathsep,
                                              os.environ.get('PATH', ''))
 
+        # Every command runs from the same directory and environment.
+        cwd = os.getcwd()
+        env = os.environ.copy()
+
         pyvers, command, command_args, options = parse_args(argv)
 
         if not pyvers:
             pyvers = get_pyvers()
 
         pyvers = norm_pyvers(pyvers)
-        validate_pyvers(pyvers)
-
-        pyver_commands = build_pyver_commands(pyvers, command, command_args)
-
-        exit_codes = []
-        success = True
-
-        for pyver, pyver_command in pyver_commands:
-            header = (
-                '🐍 pydo: Python %s: %s'
-                % (pyver, subprocess.list2cmdline(pyver_command))
-            )
 
-            print('=' * len(header))
-            print(header)
-            print('=' * len(header))
-
-            exit_code = run_pyver_command(pyver_command)
-            exit_codes.append(exit_code)
-
-            if exit_code != 0:
-                success = False
-
-                if options.fail_fast:
-                    sys.exit(exit_code)
+        pyver_commands, resolved_pyvers = build_pyver_commands(
+            pyvers, command, command_args)
+        validate_resolved(resolved_pyvers)
+
+        if len(pyver_commands) == 1 and os.name == 'posix':
+            # There's nothing to run in parallel, so just replace this
+            # process with the command. Its exit code and any signals will
+            # pass straight through.
+            #
+            # This isn't done on Windows, where the exec functions start a
+            # new process and exit this one immediately.
+            pyver, pyver_command, header = pyver_commands[0]
+
+            sys.stdout.write(header)
+            sys.stdout.write('\n')
+            sys.stdout.flush()
+
+            os.execvpe(pyver_command[0], pyver_command, env)
+
+        exit_codes = run_pyver_commands(pyver_commands,
+                                        fail_fast=options.fail_fast,
+                                        max_jobs=options.jobs,
+                                        cwd=cwd,
+                                        env=env)
+        failed_exit_codes = [
+            exit_code
+            for exit_code in exit_codes
+            if exit_code
+        ]
 
-        if not success:
-            sys.exit(max(exit_codes))
+        if failed_exit_codes:
+            sys.exit(max(failed_exit_codes))
     except Exception as e:
         sys.stderr.write('ERROR: %s\n' % e)
         sys.exit(1)
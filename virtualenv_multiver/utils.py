@@ -6,10 +6,14 @@ Version Added:
 
 import os
 import re
+import shutil
 import sys
 
 
+_SPLIT_PYVERS_RE = re.compile(r'[\s,]+')
+
 _which_cache = {}
+_which_cache_path = None
 
 
 class PyVerError(ValueError):
@@ -30,31 +34,32 @@ def norm_pyvers(pyvers):
         list of str:
         The normalized list of Python versions.
     """
+    seen = set()
     norm_pyvers = []
 
     for pyver in pyvers:
-        if not pyver or pyver in norm_pyvers:
+        if not pyver or pyver in seen:
             continue
 
         if '-' in pyver:
-            parts = pyver.split('-')
-            min_pyver = parts[0].split('.')
-            max_pyver = parts[1].split('.')
+            min_pyver, _, max_pyver = pyver.partition('-')
+            min_major, _, min_minor = min_pyver.partition('.')
+            max_major, _, max_minor = max_pyver.partition('.')
 
-            if min_pyver[0] != max_pyver[0]:
+            if min_major != max_major:
                 raise PyVerError(
                     'Cannot use version ranges (%s-%s) with different major '
                     'Python versions!'
-                    % (parts[0], parts[1]))
-
-            major_pyver = min_pyver[0]
+                    % (min_pyver, max_pyver))
 
-            for i in range(int(min_pyver[1]), int(max_pyver[1]) + 1):
-                pyver = '%s.%s' % (major_pyver, i)
+            for i in range(int(min_minor), int(max_minor) + 1):
+                range_pyver = f'{min_major}.{i}'
 
-                if pyver not in norm_pyvers:
-                    pyvers.append('%s.%s' % (major_pyver, i))
+                if range_pyver not in seen:
+                    seen.add(range_pyver)
+                    norm_pyvers.append(range_pyver)
         else:
+            seen.add(pyver)
             norm_pyvers.append(pyver)
 
     return norm_pyvers or None
@@ -72,32 +77,28 @@ def split_pyvers(pyvers_str):
         list of str:
         The list of Python versions.
     """
-    return norm_pyvers(re.split(r'[\s,]+', pyvers_str))
-
+    return norm_pyvers(_SPLIT_PYVERS_RE.split(pyvers_str))
 
-def validate_pyvers(pyvers):
-    """Validate a list of Python versions.
 
-    This will check each Python version in a list to ensure a valid Python
-    executable can be found.
+def validate_resolved(resolved_pyvers):
+    """Validate the Python executables resolved for a list of versions.
 
     Args:
-        pyvers (list of str):
-            The normalized list of Python versions.
+        resolved_pyvers (dict):
+            A mapping of each Python version to the resolved path of its
+            ``pythonX.Y`` executable, or ``None`` if it wasn't found.
 
     Raises:
         virtualenv_multiver.utils.PyVerError:
-            One or more versions could not be found.
+            No versions were provided, or one or more could not be found.
     """
-    if not pyvers:
+    if not resolved_pyvers:
         raise PyVerError('No suitable versions of Python were found in any '
                          'configuration file or on the command line.')
 
-    for pyver in pyvers:
-        python_exe = 'python%s' % pyver
-
-        if not which(python_exe):
-            raise PyVerError('%s was not found in the path.' % python_exe)
+    for pyver, python_path in resolved_pyvers.items():
+        if not python_path:
+            raise PyVerError('python%s was not found in the path.' % pyver)
 
 
 def which(name):
@@ -107,31 +108,36 @@ def which(name):
     It will append the proper extension as necessary. For example, use
     "myapp" and not "myapp.exe".
 
-    Results are cached for future lookup.
+    Results are cached for future lookup, until :envvar:`PATH` changes.
 
     Args:
         name (str):
             The name of the executable.
 
     Returns:
-        bool:
-        ``True`` if the app is in the path. ``False`` if it is not.
+        str:
+        The path to the executable, or ``None`` if it's not in the path.
     """
+    global _which_cache_path
+
+    path = os.environ.get('PATH', '')
+
+    if path != _which_cache_path:
+        # The search path has changed, so any cached results may be stale.
+        _which_cache.clear()
+        _which_cache_path = path
+
     try:
         return _which_cache[name]
     except KeyError:
-        # Python < 3.3
-        if sys.platform == 'win32' and not name.endswith('.exe'):
-            name = '%s.exe' % name
-
-        for dir in os.environ['PATH'].split(os.pathsep):
-            candidate = os.path.join(os.path.join(dir, name))
-
-            if os.path.exists(candidate):
-                return candidate
+        pass
 
-        result = None
+    if sys.platform == 'win32' and not name.endswith('.exe'):
+        exe_name = '%s.exe' % name
+    else:
+        exe_name = name
 
-        _which_cache[name] = result
+    result = shutil.which(exe_name, path=path)
+    _which_cache[name] = result
 
-        return result
+    return result